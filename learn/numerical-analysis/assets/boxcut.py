@@ -0,0 +1,42 @@
+import numpy as np
+
+def sat(points, xedges, yedges):
+    h = np.histogram2d(points[:,0],points[:,1],bins=[xedges,yedges])[0]
+    s = np.zeros((len(xedges),len(yedges)))
+    s[1:,1:] = h.cumsum(axis=0).cumsum(axis=1)
+    return s
+
+def box_counts(s, i):
+    d = s-s[i]
+    return d[:,None,:]-d[:,:,None]
+
+def box_search(sig, bkg, xedges, yedges=None):
+    if yedges is None: yedges = xedges
+    ssig, sbkg = sat(sig,xedges,yedges), sat(bkg,xedges,yedges)
+    lower = np.tril(np.ones((len(yedges),len(yedges)),bool),-1)
+    best, fom = None, -1.
+    for i in range(len(xedges)):
+        nsig, nbkg = box_counts(ssig,i)[i:], box_counts(sbkg,i)[i:]
+        ntot = nsig+nbkg
+        res = np.where(ntot<1,0.,nsig/np.sqrt(np.maximum(ntot,1.)))
+        res[:,lower] = -1.
+        k = res.argmax()
+        if res.flat[k]>fom:
+            j, c, d = np.unravel_index(k,res.shape)
+            best, fom = (xedges[i],xedges[i+j],yedges[c],yedges[d]), res.flat[k]
+    return best, fom
+
+def box_count(points, boxes):
+    x, y = points[:,0], points[:,1]
+    return ((x>boxes[:,0,None]) & (x<boxes[:,1,None]) &
+            (y>boxes[:,2,None]) & (y<boxes[:,3,None])).sum(axis=1)
+
+def box_fitness(boxes, sig, bkg):
+    boxes = np.atleast_2d(boxes)
+    res = np.empty(len(boxes))
+    step = max(1,2**22//max(len(sig),len(bkg)))
+    for k in range(0,len(boxes),step):
+        nsig = box_count(sig,boxes[k:k+step])
+        ntot = nsig+box_count(bkg,boxes[k:k+step])
+        res[k:k+step] = np.where(ntot<1,0.,nsig/np.sqrt(np.maximum(ntot,1)))
+    return res
@@ -0,0 +1,109 @@
+import numpy as np
+import scipy.optimize as opt
+import multiprocessing as mp
+
+HESS_METHODS = ('Newton-CG','dogleg','trust-ncg','trust-krylov','trust-exact','trust-constr')
+
+class chi2(object):
+    def __init__(self, x, y, yerr, xmin, xmax, xbinwidth):
+        self.x, self.y, self.yerr = x, y, yerr
+        self.xbinwidth = xbinwidth
+        xp = (x-xmin)/(xmax-xmin)
+        self.poly = np.vstack([np.ones_like(xp),xp,xp**2]).T
+        self.w = 1./yerr
+
+    def terms(self, mean, sigma):
+        u = (self.x-mean)/sigma
+        g = self.xbinwidth/(2.*np.pi)**0.5/sigma*np.exp(-0.5*u*u)
+        return u, g
+
+    def model(self, p):
+        u, g = self.terms(p[1],p[2])
+        return p[0]*g+np.dot(self.poly,p[3:])
+
+    def jacobian(self, p):
+        u, g = self.terms(p[1],p[2])
+        ng = p[0]*g/p[2]
+        return np.hstack([np.vstack([g,ng*u,ng*(u*u-1.)]).T,self.poly])
+
+    def __call__(self, p):
+        return (((self.y-self.model(p))*self.w)**2).sum()
+
+    def fcn_grad(self, p):
+        u, g = self.terms(p[1],p[2])
+        r = (self.y-p[0]*g-np.dot(self.poly,p[3:]))*self.w
+        ng = p[0]*g/p[2]
+        J = np.hstack([np.vstack([g,ng*u,ng*(u*u-1.)]).T,self.poly])*self.w[:,None]
+        return (r*r).sum(), -2.*np.dot(r,J)
+
+    def gradient(self, p):
+        return self.fcn_grad(p)[1]
+
+    def hessian(self, p):
+        J = self.jacobian(p)*self.w[:,None]
+        return 2.*np.dot(J.T,J)
+
+    def linear(self, mean, sigma):
+        u, g = self.terms(mean,sigma)
+        A = np.hstack([g[:,None],self.poly])*self.w[:,None]
+        coef = np.linalg.lstsq(A,self.y*self.w,rcond=None)[0]
+        return np.r_[coef[0],mean,sigma,coef[1:]]
+
+    def fcn_grad_linear(self, q):
+        # the linear parameters are at their optimum, so only the mean/sigma
+        # components of the full gradient survive
+        f, g = self.fcn_grad(self.linear(q[0],q[1]))
+        return f, g[1:3]
+
+    def fit(self, p_init, linear=False, method='BFGS'):
+        hess = self.hessian if method in HESS_METHODS else None
+        if not linear:
+            return opt.minimize(self.fcn_grad,p_init,jac=True,hess=hess,method=method)
+        r = opt.minimize(self.fcn_grad_linear,np.asarray(p_init)[1:3],jac=True,method=method)
+        r.x = self.linear(r.x[0],r.x[1])
+        return r
+
+def fcn_grad_fixed(q, fcn, index, value):
+    f, g = fcn.fcn_grad(np.insert(q,index,value))
+    return f, np.delete(g,index)
+
+def profile_chunk(args):
+    fcn, index, grid, p_start = args
+    chi2s = np.empty(len(grid))
+    params = np.empty((len(grid),len(p_start)))
+    # scan outwards from the grid point closest to the start so each point
+    # warm-starts from its already fitted neighbour
+    k0 = abs(grid-p_start[index]).argmin()
+    q = np.delete(p_start,index)
+    for order in (range(k0,len(grid)),range(k0-1,-1,-1)):
+        for k in order:
+            r = opt.minimize(fcn_grad_fixed,q,args=(fcn,index,grid[k]),jac=True,method='BFGS')
+            chi2s[k], params[k] = r.fun, np.insert(r.x,index,grid[k])
+            q = r.x
+        q = np.delete(params[k0],index)
+    return chi2s, params
+
+def profile_scan(fcn, index, grid, p_best, processes=None, chunks=None):
+    grid = np.asarray(grid,dtype=float)
+    if chunks is None: chunks = processes or 1
+    parts = np.array_split(grid,chunks)
+    tasks = [(fcn,index,g,np.asarray(p_best,dtype=float)) for g in parts]
+    if processes:
+        with mp.Pool(processes) as pool: res = pool.map(profile_chunk,tasks)
+    else: res = [profile_chunk(t) for t in tasks]
+    chi2s = np.concatenate([r[0] for r in res])
+    params = np.vstack([r[1] for r in res])
+    return chi2s-min(chi2s.min(),fcn(p_best)), params
+
+def interval(grid, dchi2, up=1.):
+    k = dchi2.argmin()
+    lo = hi = np.nan
+    left = np.flatnonzero(dchi2[:k]>=up)
+    if len(left):
+        i = left[-1]
+        lo = np.interp(up,[dchi2[i+1],dchi2[i]],[grid[i+1],grid[i]])
+    right = np.flatnonzero(dchi2[k:]>=up)
+    if len(right):
+        i = k+right[0]
+        hi = np.interp(up,[dchi2[i-1],dchi2[i]],[grid[i-1],grid[i]])
+    return lo, hi
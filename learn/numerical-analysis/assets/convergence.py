@@ -0,0 +1,45 @@
+import time
+import platform
+import numpy as np
+from rk import TABLEAU, ensemble
+
+def sweep(f, y0, t_end, nsteps, method='rk4'):
+    # integrate all step sizes side by side; runs that are done get h=0
+    nsteps = np.asarray(nsteps)
+    y0 = np.atleast_1d(np.asarray(y0,dtype=float))
+    y = np.empty(nsteps.shape+y0.shape)
+    y[:] = y0
+    h = (t_end/nsteps).reshape(nsteps.shape+(1,)*y0.ndim)
+    n = nsteps.reshape(h.shape)
+    sim = ensemble(f, y, method=method)
+    for i in range(nsteps.max()):
+        sim.step(np.where(i<n,h,0.))
+    return sim.y
+
+def timing(f, y0, t_end, n, method='rk4', repeat=1):
+    best = np.inf
+    for r in range(repeat):
+        sim = ensemble(f, np.atleast_1d(y0), method=method)
+        start = time.perf_counter()
+        for i in range(n): sim.step(t_end/n)
+        best = min(best,time.perf_counter()-start)
+    return best
+
+def orders(h, err):
+    return np.diff(np.log(err))/np.diff(np.log(h))
+
+def report(f, exact, y0, t_end, nsteps, methods=('euler','rk2','rk4'), repeat=1):
+    nsteps = np.asarray(nsteps)
+    h = t_end/nsteps
+    res = {'problem': {'t_end': t_end, 'y0': np.atleast_1d(y0).tolist(), 'nsteps': nsteps.tolist(), 'h': h.tolist()},
+           'environment': {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine()},
+           'methods': {}}
+    ref = exact(t_end)
+    for method in methods:
+        y = sweep(f, y0, t_end, nsteps, method)
+        err = abs(y-ref).reshape(len(nsteps),-1).max(axis=1)/abs(ref).max()
+        nfev = nsteps*len(TABLEAU[method][1])
+        wall = [timing(f, y0, t_end, int(n), method, repeat) for n in nsteps]
+        res['methods'][method] = {'error': err.tolist(), 'nfev': nfev.tolist(), 'wall': wall,
+                                  'order': orders(h, err).tolist()}
+    return res
@@ -0,0 +1,73 @@
+import os
+import numpy as np
+
+def one_hot(labels, n_classes=None, dtype=np.float64):
+    labels = np.asarray(labels)
+    if n_classes is None: n_classes = labels.max()+1
+    out = np.zeros((len(labels),n_classes),dtype)
+    out[np.arange(len(labels)),labels] = 1
+    return out
+
+class dataset(object):
+    def __init__(self, path, cache=None):
+        self.path = path
+        self.cache = cache or os.path.splitext(path)[0]+'-cache'
+        self.arrays = {}
+        index = os.path.join(self.cache,'keys.txt')
+        if not os.path.exists(index) or os.path.getmtime(index)<os.path.getmtime(path):
+            self.convert()
+        with open(index) as f:
+            self.names = f.read().split()
+
+    def file(self, key, kind='raw'):
+        return os.path.join(self.cache,'%s.%s.npy' % (key,kind))
+
+    def save(self, fn, arr):
+        # write under a private name and rename, so that concurrent readers
+        # only ever see complete files
+        tmp = fn+'.%d.tmp' % os.getpid()
+        with open(tmp,'wb') as f: np.save(f,arr)
+        os.replace(tmp,fn)
+
+    def convert(self):
+        if not os.path.isdir(self.cache): os.makedirs(self.cache,exist_ok=True)
+        with np.load(self.path) as data:
+            names = list(data.keys())
+            for key in names:
+                arr = data[key]
+                self.save(self.file(key), arr)
+                try: os.remove(self.file(key,'f32'))
+                except FileNotFoundError: pass
+                if key.startswith('y_'):
+                    self.save(self.file(key,'onehot'), one_hot(arr,dtype=np.float32))
+        tmp = os.path.join(self.cache,'keys.txt.%d.tmp' % os.getpid())
+        with open(tmp,'w') as f:
+            f.write('\n'.join(names))
+        os.replace(tmp,os.path.join(self.cache,'keys.txt'))
+
+    def keys(self):
+        return list(self.names)
+
+    def load(self, key, kind):
+        if (key,kind) not in self.arrays:
+            self.arrays[(key,kind)] = np.load(self.file(key,kind), mmap_mode='r')
+        return self.arrays[(key,kind)]
+
+    def __getitem__(self, key):
+        return self.load(key,'raw')
+
+    def images(self, key):
+        fn = self.file(key,'f32')
+        if not os.path.exists(fn):
+            raw = self[key]
+            tmp = fn+'.%d.tmp' % os.getpid()
+            out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float32, shape=raw.shape)
+            for i in range(0,len(raw),4096):
+                np.divide(raw[i:i+4096],255.,out=out[i:i+4096])
+            out.flush()
+            del out
+            os.replace(tmp,fn)
+        return self.load(key,'f32')
+
+    def onehot(self, key):
+        return self.load(key,'onehot')
@@ -0,0 +1,24 @@
+import numpy as np
+from scipy.optimize import brentq
+
+# event functions follow the solve_ivp convention: g(t,y) is a scalar whose
+# zero marks the event, with optional attributes 'terminal' (stop there) and
+# 'direction' (+1 rising, -1 falling, 0 both)
+
+def values(events, t, y):
+    return np.array([g(t,y) for g in events])
+
+def crossings(events, t_old, g_old, t_new, g_new, sol, xtol=1E-14):
+    direction = np.array([getattr(g,'direction',0.) for g in events])
+    up = (g_old<0.) & (g_new>=0.) & (direction>=0.)
+    down = (g_old>0.) & (g_new<=0.) & (direction<=0.)
+    found = []
+    for i in np.flatnonzero(up|down):
+        if g_new[i]==0.: te = t_new
+        else: te = brentq(lambda t: events[i](t,sol(t)), t_old, t_new, xtol=xtol)
+        found.append((te,i))
+    hits = []
+    for te, i in sorted(found):
+        hits.append((i,te,sol(te)))
+        if getattr(events[i],'terminal',False): break
+    return hits
@@ -0,0 +1,30 @@
+import os
+import hashlib
+import numpy as np
+
+def flatten(images):
+    return images.reshape((len(images),-1))
+
+def mean_features(images):
+    out = np.empty((len(images),2))
+    np.mean(images,axis=(1,2),dtype=np.float64,out=out[:,0])
+    np.mean(images[:,10:18,11:17],axis=(1,2),dtype=np.float64,out=out[:,1])
+    return out
+
+def digest(data, key, select=None):
+    # identify the input by its source file and selection, not its pixels
+    h = hashlib.sha1(('%s %r %s' % (os.path.abspath(data.path),os.path.getmtime(data.path),key)).encode())
+    if select is not None: h.update(np.ascontiguousarray(select).data)
+    return h.hexdigest()
+
+def cached(func, data, key, select=None, cache='features-cache'):
+    fn = os.path.join(cache,'%s.%s.npy' % (func.__name__,digest(data,key,select)))
+    if os.path.exists(fn): return np.load(fn)
+    images = data.images(key)
+    if select is not None: images = images[select]
+    out = func(images)
+    if not os.path.isdir(cache): os.makedirs(cache)
+    tmp = fn+'.%d.tmp' % os.getpid()
+    with open(tmp,'wb') as f: np.save(f,out)
+    os.replace(tmp,fn)
+    return out
@@ -0,0 +1,55 @@
+import numpy as np
+import multiprocessing as mp
+
+worker = {}
+
+def worker_init(fcn):
+    worker['fcn'] = fcn
+
+def worker_fitness(chromo):
+    return worker['fcn'](chromo)
+
+class genetic(object):
+    def __init__(self, fcn, chromo, pmut=0.2, smut=0.2):
+        self.fcn = fcn
+        self.chromo = np.array(chromo,dtype=float)
+        self.fitness = None
+        self.pmut, self.smut = pmut, smut
+
+    def evaluate(self, chromo, pool=None):
+        if pool is None: return np.asarray(self.fcn(chromo),dtype=float)
+        chunks = np.array_split(chromo,self.processes)
+        return np.concatenate(pool.map(worker_fitness,chunks))
+
+    def crossover(self, x, y):
+        return np.where(np.random.rand(*x.shape)<0.5,x,y)
+
+    def mutation(self, x):
+        mask = np.random.rand(*x.shape)<self.pmut
+        x[mask] += np.random.randn(mask.sum())*self.smut
+        return x
+
+    def generation(self, pool=None):
+        population = len(self.chromo)
+        pick = np.random.randint(0,population,(population,2))
+        child = self.mutation(self.crossover(self.chromo[pick[:,0]],self.chromo[pick[:,1]]))
+        chromo = np.vstack([self.chromo,child])
+        fitness = np.concatenate([self.fitness,self.evaluate(child,pool)])
+        rank = (-fitness).argsort(kind='stable')[:population] # drop low rank chromosome
+        self.chromo, self.fitness = chromo[rank], fitness[rank]
+
+    def evolve(self, generations, tol=1E-3, processes=None, verbose=True):
+        self.processes = processes
+        # fcn (and whatever data it carries) is shipped once per worker
+        pool = mp.Pool(processes,worker_init,(self.fcn,)) if processes else None
+        try:
+            if self.fitness is None: self.fitness = self.evaluate(self.chromo,pool)
+            for gen in range(generations):
+                self.generation(pool)
+                if verbose: print('gen:',gen+1,'best chromo =',self.chromo[0],'fitness =',self.fitness[0])
+                if self.fitness.std()/self.fitness.mean()<tol: break
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return self.chromo[0], self.fitness[0]
@@ -0,0 +1,20 @@
+import numpy as np
+import time
+from roots import bisect, solve
+
+# Kepler's equation E - e*sin(E) = M for many mean anomalies M at once
+def f(E, M, e):
+    return E-e*np.sin(E)-M
+def fp(E, M, e):
+    return 1.-e*np.cos(E)
+
+e = 0.6
+M = np.random.rand(1000000)*2.*np.pi
+
+for name, solver in [('bisection', lambda: bisect(f, M-e, M+e, args=(M,e))),
+                     ('inverse quadratic', lambda: solve(f, M-e, M+e, args=(M,e))),
+                     ('newton', lambda: solve(f, M-e, M+e, fp=fp, args=(M,e)))]:
+    t0 = time.time()
+    E, ok = solver()
+    print('%-18s: %.3f s, converged = %d/%d, max residual = %.3e' % \
+        (name, time.time()-t0, ok.sum(), len(M), abs(f(E,M,e)).max()))
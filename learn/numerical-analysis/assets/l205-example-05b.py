@@ -0,0 +1,19 @@
+import numpy as np
+import scipy.optimize as opt
+import time
+from nthroot import squareroot, cubicroot
+
+R = np.random.rand(1000000)*1E6
+
+def bench(name, func, ref):
+    t0 = time.time()
+    x = func()
+    print('%-22s: %.4f s, max rel. diff = %.3e' % (name, time.time()-t0, abs(x/ref-1.).max()))
+
+sq, cb = np.sqrt(R), np.cbrt(R)
+bench('np.sqrt', lambda: np.sqrt(R), sq)
+bench('squareroot (newton)', lambda: squareroot(R), sq)
+bench('opt.newton (square)', lambda: opt.newton(lambda x:x*x-R, R*0.5, lambda x:2.*x), sq)
+bench('np.cbrt', lambda: np.cbrt(R), cb)
+bench('cubicroot (newton)', lambda: cubicroot(R), cb)
+bench('opt.newton (cubic)', lambda: opt.newton(lambda x:x*x*x-R, R*0.5, lambda x:3.*x*x), cb)
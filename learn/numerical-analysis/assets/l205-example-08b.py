@@ -0,0 +1,15 @@
+import numpy as np
+import time
+from minimize import minimize, golden
+
+def f(x, p):
+    return (x-p)*(x-p)*(x-10.)*(x-10.)
+
+p = np.random.rand(1000000)*1.6+0.2
+
+for name, solver in [('golden section', golden),
+                     ('parabolic', minimize)]:
+    t0 = time.time()
+    x, ok = solver(f, np.zeros(len(p)), np.full(len(p),2.), args=(p,))
+    print('%-15s: %.3f s, converged = %d/%d, max diff = %.3e' % \
+        (name, time.time()-t0, ok.sum(), len(p), abs(x-p).max()))
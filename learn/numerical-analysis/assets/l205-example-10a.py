@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.optimize as opt
 import matplotlib.pyplot as plt
 
 xmin, xmax, xbinwidth = 100., 170., 2.
@@ -22,13 +21,11 @@ def model(x, norm, mean, sigma, c0, c1, c2):
     
     return polynomial + gaussian    
     
-def fcn(p):    
-    expt = model(vx,p[0],p[1],p[2],p[3],p[4],p[5])
-    delta = (vy-expt)/vyerr
-    return (delta**2).sum()
-    
+from chi2fit import chi2
+fcn = chi2(vx,vy,vyerr,xmin,xmax,xbinwidth)
+
 p_init = np.array([70.,125.,2.,4.,0.,0.])
-r = opt.minimize(fcn,p_init)
+r = fcn.fit(p_init)
 
 if r.success:
     print('N(Higgs)  = %.1f events' % r.x[0])
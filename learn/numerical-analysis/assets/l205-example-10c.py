@@ -0,0 +1,32 @@
+import numpy as np
+import scipy.optimize as opt
+from toys import run_toys
+
+xmin, xmax, xbinwidth = 100., 170., 2.
+vx = np.linspace(xmin+xbinwidth/2,xmax-xbinwidth/2,35)
+vy = np.array(
+[7,2,4,4,3,9,8,1,6,6,8,16,36,20,8,6,8,6,4,7,
+ 4,10,5,6,1,4,3,4,4,6,2,6,9,5,8],dtype='float64')
+vyerr = vy**0.5
+
+def model(x, norm, mean, sigma, c0, c1, c2):
+
+    xp = (x-xmin)/(xmax-xmin)
+    polynomial = c0 + c1*xp + c2*xp**2
+
+    gaussian = norm*xbinwidth/(2.*np.pi)**0.5/sigma * \
+        np.exp(-0.5*((x-mean)/sigma)**2)
+
+    return polynomial + gaussian
+
+if __name__ == '__main__':
+    p_init = np.array([70.,125.,2.,4.,0.,0.])
+    rx,rcov = opt.curve_fit(model,vx,vy,p_init,vyerr)
+
+    params, covs, pulls, coverage = run_toys(model, vx, model(vx,*rx), rx, 10000, seed=1)
+
+    ok = np.isfinite(pulls).all(axis=1)
+    print('Converged toys: %d/%d' % (ok.sum(),len(ok)))
+    for name, pull, cov in zip(['norm','mean','sigma','c0','c1','c2'], pulls[ok].T, coverage):
+        print('%-5s pull mean = %+.3f, pull width = %.3f, 1-sigma coverage = %.3f' % \
+            (name, pull.mean(), pull.std(), cov))
@@ -0,0 +1,29 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from chi2fit import chi2, profile_scan, interval
+
+xmin, xmax, xbinwidth = 100., 170., 2.
+vx = np.linspace(xmin+xbinwidth/2,xmax-xbinwidth/2,35)
+vy = np.array(
+[7,2,4,4,3,9,8,1,6,6,8,16,36,20,8,6,8,6,4,7,
+ 4,10,5,6,1,4,3,4,4,6,2,6,9,5,8],dtype='float64')
+vyerr = vy**0.5
+
+if __name__ == '__main__':
+    fcn = chi2(vx,vy,vyerr,xmin,xmax,xbinwidth)
+    r = fcn.fit(np.array([70.,125.,2.,4.,0.,0.]))
+
+    grid = np.linspace(122.,128.,1000)
+    dchi2, params = profile_scan(fcn, 1, grid, r.x, processes=4)
+    lo, hi = interval(grid, dchi2)
+    print('M(Higgs) = %.2f, 68%% interval = [%.2f, %.2f] GeV' % (r.x[1],lo,hi))
+    lo, hi = interval(grid, dchi2, 4.)
+    print('             95%% interval = [%.2f, %.2f] GeV' % (lo,hi))
+
+    plt.plot(grid, dchi2, lw=2)
+    plt.plot([grid[0],grid[-1]],[1.,1.],c='gray',ls='--')
+    plt.plot([grid[0],grid[-1]],[4.,4.],c='gray',ls='--')
+    plt.xlabel('M(Higgs) [GeV]')
+    plt.ylabel('$\\Delta\\chi^2$')
+    plt.grid()
+    plt.show()
@@ -3,11 +3,12 @@ import matplotlib.pyplot as plt
 
 def f(t,y): return y
 
-vt,y1,vy2,vy4 = [],[],[],[]
+from recorder import recorder
 
 t = 0.
 y1 = y2 = y4 = 1.
 h = 0.001
+rec = recorder(3, samples=2000, nsteps=200./h)
 while t<200.:
     k1  = f(t, y1)
     y1 += h*k1
@@ -24,14 +25,12 @@ while t<200.:
     
     t += h
     
-    vt.append(t)
-    vy1.append(abs(y1-np.exp(t))/np.exp(t))
-    vy2.append(abs(y2-np.exp(t))/np.exp(t))
-    vy4.append(abs(y4-np.exp(t))/np.exp(t))
+    rec(t, y1, y2, y4)
 
-plt.plot(vt,vy1,lw=2,c='Blue')
-plt.plot(vt,vy2,lw=2,c='Green')
-plt.plot(vt,vy4,lw=2,c='Red')
+err = rec.relerr(np.exp)
+plt.plot(rec.t,err[:,0],lw=2,c='Blue')
+plt.plot(rec.t,err[:,1],lw=2,c='Green')
+plt.plot(rec.t,err[:,2],lw=2,c='Red')
 plt.yscale('log')
 plt.ylim(1E-16,0.2)
 plt.show()
\ No newline at end of file
@@ -0,0 +1,30 @@
+import sys
+import json
+import numpy as np
+import matplotlib.pyplot as plt
+from convergence import report
+
+def f(t,y,dydt): dydt[:] = y
+
+nsteps = np.unique(np.round(np.logspace(1,4,13)).astype(int))
+res = report(f, np.exp, 1., 1., nsteps, repeat=3)
+
+for method, r in res['methods'].items():
+    print('%s method:' % method)
+    for h, err, nfev, wall in zip(res['problem']['h'], r['error'], r['nfev'], r['wall']):
+        print('  h = %.3e, RHS calls = %6d, time = %.3e s, diff: %.3e' % (h, nfev, wall, err))
+
+if len(sys.argv)>1:
+    with open(sys.argv[1],'w') as fout:
+        json.dump(res, fout, indent=1)
+
+colors = {'euler':'Blue', 'rk2':'Green', 'rk4':'Red'}
+for method, r in res['methods'].items():
+    plt.plot(r['nfev'], r['error'], 'o-', lw=2, c=colors[method], label=method)
+plt.xscale('log')
+plt.yscale('log')
+plt.xlabel('RHS evaluations')
+plt.ylabel('relative error at t=1')
+plt.legend()
+plt.grid()
+plt.show()
@@ -0,0 +1,37 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy.special import ellipk
+from rk import ensemble
+
+m, g, R = 1., 9.8, 1.
+h = 0.001
+
+def f(t, y, dydt):
+    dydt[:,0] = y[:,1]
+    np.sin(y[:,0], out=dydt[:,1])
+    dydt[:,1] *= -g/R
+
+theta0 = np.linspace(0.01,np.pi*0.99,20000)
+y = np.zeros((len(theta0),2))
+y[:,0] = theta0
+
+# a pendulum released at rest passes theta=0 after a quarter period
+quarter = np.full(len(theta0),np.nan)
+sim = ensemble(f, y)
+while np.isnan(quarter).any():
+    t, prev = sim.t, sim.y[:,0].copy()
+    theta = sim.step(h)[:,0]
+    cross = np.isnan(quarter) & (prev>0.) & (theta<=0.)
+    quarter[cross] = t+h*prev[cross]/(prev[cross]-theta[cross])
+
+period = 4.*quarter
+exact = 4.*(R/g)**0.5*ellipk(np.sin(theta0/2.)**2)
+print('max. relative difference to the exact period: %.3e' % abs(period/exact-1.).max())
+
+plt.plot(theta0, period, lw=3, c='red')
+plt.plot(theta0, exact, lw=1, c='black', ls='--')
+plt.plot([0.,np.pi], [2.*np.pi*(R/g)**0.5]*2, c='gray', ls=':')
+plt.xlabel('initial angle (rad)')
+plt.ylabel('period (s)')
+plt.grid()
+plt.show()
@@ -0,0 +1,30 @@
+import numpy as np
+from scipy.special import ellipk
+from rk45 import cashkarp
+from odestream import stream
+
+g, R = 9.8, 1.
+
+def f(t,y):
+    return np.array([y[1],-g/R*np.sin(y[0])])
+
+# the pendulum swings through theta=0 in the same direction once per period
+def bottom(t,y):
+    return y[0]
+bottom.direction = -1.
+
+# stop as soon as it comes back to rest on the far side
+def turn(t,y):
+    return y[1]
+turn.direction = +1.
+turn.terminal = True
+
+for theta0 in [0.1, 1.0, 2.0, 3.0]:
+    exact = 4.*(R/g)**0.5*ellipk(np.sin(theta0/2.)**2)
+    sim = stream(f, 0., [theta0,0.], events=[bottom], rtol=1E-11, atol=1E-12)
+    sim.advance(10.*exact)
+    period = np.diff(sim.t_events[0]).mean()
+    half = cashkarp(f, 0., [theta0,0.], events=[turn])
+    half.advance(10.*exact)
+    print('theta0 = %.1f: period = %.12f (exact %.12f), half period = %.12f after %d RHS calls' %
+          (theta0, period, exact, half.t, half.nfev))
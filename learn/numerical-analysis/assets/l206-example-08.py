@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 m, g, R = 1., 9.8, 1.
 t = 0.
@@ -12,11 +12,10 @@ def f(t,y):
     
     return np.array([thetap,thetapp])
 
+sim = stream(f, t, y)
 while t<8.:
-    sol = solve_ivp(f, [t, t+0.1], y)
-    
-    y      = sol.y[:,-1]
-    t      = sol.t[-1]
+    t     += 0.1
+    y      = sim.advance(t)
     theta  = y[0]
     thetap = y[1]
 
@@ -1,7 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 fig = plt.figure(figsize=(6,6), dpi=80)
 ax = plt.axes(xlim=(-1.2,+1.2), ylim=(-1.2,+1.2))
@@ -21,6 +21,8 @@ def f(t,y):
     
     return np.array([thetap,thetapp])
 
+sim = stream(f, t, y)
+
 def init():
     stick.set_data([], [])
     ball.set_data([], [])
@@ -30,9 +32,8 @@ def init():
 def animate(i):
     global t, y
     
-    sol = solve_ivp(f, [t, t+0.040], y)
-    y   = sol.y[:,-1]
-    t   = sol.t[-1]
+    t  += 0.040
+    y   = sim.advance(t)
     
     theta   = y[0]
     thetap  = y[1]
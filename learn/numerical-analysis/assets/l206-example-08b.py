@@ -1,6 +1,6 @@
 import numpy as np
 from vpython import *
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 scene = canvas(width=480, height=480)
 floor = box(pos=vector(0.,-1.1,0.), length=2.2, height=0.01, width=1.2, opacity=0.2)
@@ -19,10 +19,10 @@ def f(t,y):
     
     return np.array([thetap,thetapp])
 
+sim = stream(f, t, y)
 while True:
-    sol = solve_ivp(f, [t, t+0.040], y)
-    y   = sol.y[:,-1]
-    t   = sol.t[-1]
+    t  += 0.040
+    y   = sim.advance(t)
     
     theta   = y[0]
     thetap  = y[1]
@@ -1,6 +1,6 @@
 import numpy as np
 from vpython import *
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 scene = canvas(width=480, height=480)
 floor = box(pos=vector(0.,-1.1,0.), length=2.2, height=0.01, width=1.2, opacity=0.2)
@@ -23,10 +23,10 @@ def f(t,y):
     
     return np.array([vx,vy,ax,ay])
 
+sim = stream(f, t, y)
 while True:
-    sol = solve_ivp(f, [t, t+0.040], y)
-    y   = sol.y[:,-1]
-    t   = sol.t[-1]
+    t  += 0.040
+    y   = sim.advance(t)
 
     bx, by = y[0], y[1]
     vx, vy = y[2], y[3]
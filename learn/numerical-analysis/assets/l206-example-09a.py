@@ -1,6 +1,6 @@
 import numpy as np
 from vpython import *
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 scene = canvas(width=480, height=480)
 floor = box(pos=vector(0.,-1.1,0.), length=2.2, height=0.01, width=1.2, opacity=0.2)
@@ -32,10 +32,10 @@ def f(t,y):
     
     return np.array([vx1,vy1,vx2,vy2,ax1,ay1,ax2,ay2])
 
+sim = stream(f, t, y)
 while True:
-    sol = solve_ivp(f, [t, t+0.040], y)
-    y   = sol.y[:,-1]
-    t   = sol.t[-1]
+    t  += 0.040
+    y   = sim.advance(t)
 
     bx1, by1 = y[0], y[1]
     bx2, by2 = y[2], y[3]
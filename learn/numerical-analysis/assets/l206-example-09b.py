@@ -0,0 +1,34 @@
+import numpy as np
+from rk import ensemble
+from symplectic import symplectic
+
+m, g, R0, k = 1., 9.8, 0.5, 100.
+q0, v0 = np.array([0.3,0.4]), np.array([0.,0.])
+
+def force(q):
+    R = (q**2).sum()**0.5
+    return -k*(R-R0)*q/R - m*g*np.array([0.,1.])
+
+def energy(q, v):
+    R = (q**2).sum()**0.5
+    return m*g*q[1] + 0.5*m*(v**2).sum() + 0.5*k*(R-R0)**2
+
+def f(t, y, dydt):
+    dydt[:2] = y[2:]
+    dydt[2:] = force(y[:2])/m
+
+E0 = energy(q0, v0)
+for h in [0.001, 0.01, 0.04]:
+    rk4 = ensemble(f, np.r_[q0,v0])
+    dE = 0.
+    while rk4.t<100.:
+        y = rk4.step(h)
+        dE = max(dE, abs(energy(y[:2],y[2:])-E0))
+    print('RK4      h = %.3f: RHS calls = %6d, max |dE| = %.3e' % (h, rk4.nfev, dE))
+    for method in ['verlet', 'leapfrog', 'yoshida']:
+        sim = symplectic(force, q0, v0, m, method=method)
+        dE = 0.
+        while sim.t<100.:
+            q, v = sim.step(h)
+            dE = max(dE, abs(energy(q,v)-E0))
+        print('%-8s h = %.3f: RHS calls = %6d, max |dE| = %.3e' % (method, h, sim.nfev, dE))
@@ -0,0 +1,31 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from springs import chain
+from rk import ensemble
+
+net = chain(50, R0=0.04, k=2000., m=0.01, angle=np.pi/2)
+sim = ensemble(net.f, net.state())
+E0 = net.energy(sim.y)
+
+fig = plt.figure(figsize=(6,6), dpi=80)
+ax = plt.axes(xlim=(-2.2,+2.2), ylim=(-3.2,+1.2))
+
+line, = ax.plot([], [], 'o-', lw=1, ms=3, color='black')
+text  = ax.text(0.,1.0,'', fontsize = 16, color='black', ha='center', va='center')
+
+def init():
+    line.set_data([], [])
+    text.set(text='')
+    return line, text
+
+def animate(i):
+    sim.run(sim.t+0.040, 0.0002)
+    x = net.positions(sim.y)
+    line.set_data(x[:,0], x[:,1])
+    text.set(text='E-E0 = %.3e' % (net.energy(sim.y)-E0))
+    return line, text
+
+anim = animation.FuncAnimation(fig, animate, init_func=init,
+                               frames=10, interval=40)
+plt.show()
@@ -1,7 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from scipy.integrate import solve_ivp
+from odestream import stream
 
 fig = plt.figure(figsize=(6,6), dpi=80)
 ax = plt.axes(xlim=(-1.,1.), ylim=(-1.,1.))
@@ -27,6 +27,13 @@ def f(t,y):
     
 ###########################################      
 
+def captured(t,y):
+    return (y[0]**2+y[1]**2)**0.5-0.05
+captured.terminal = True
+captured.direction = -1.
+
+sim = stream(f, t, y, events=[captured])
+
 def init():
     ball.set_data([], [])
     return ball
@@ -34,9 +41,11 @@ def init():
 def animate(i):
     global y, t
     
-    sol = solve_ivp(f, [t, t+0.025], y)
-    y   = sol.y[:,-1]
-    t   = sol.t[-1]
+    t  += 0.025
+    y   = sim.advance(t)
+    if sim.terminated:
+        print('captured at t = %.6f' % sim.t_events[0][0])
+        anim.event_source.stop()
     
     px = y[0]
     py = y[1]
@@ -1,6 +1,7 @@
 import numpy as np
 
-mnist = np.load('mnist.npz')
+from dataset import dataset
+mnist = dataset('mnist.npz')
 x_train = mnist['x_train']
 y_train = mnist['y_train']
 
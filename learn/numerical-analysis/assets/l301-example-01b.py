@@ -1,7 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
+from dataset import dataset
+mnist = dataset('mnist.npz')
 x_train = mnist['x_train']
 y_train = mnist['y_train']
 zero_and_one = x_train[y_train<=1]
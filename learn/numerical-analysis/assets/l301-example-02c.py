@@ -1,12 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train']
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')
 y_train = mnist['y_train']
 
-sample0 = x_train[y_train==0]/255.
-sample1 = x_train[y_train==1]/255.
+sample0 = x_train[y_train==0]
+sample1 = x_train[y_train==1]
 
 all_mean0 = sample0.mean(axis=(1,2))
 all_mean1 = sample1.mean(axis=(1,2))
@@ -2,12 +2,13 @@ import numpy as np
 import scipy.linalg as linalg
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train']
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')
 y_train = mnist['y_train']
 
-sample0 = x_train[y_train==0]/255.
-sample1 = x_train[y_train==1]/255.
+sample0 = x_train[y_train==0]
+sample1 = x_train[y_train==1]
 
 var0 = np.vstack([sample0.mean(axis=(1,2)),sample0[:,10:18,11:17].mean(axis=(1,2))])
 var1 = np.vstack([sample1.mean(axis=(1,2)),sample1[:,10:18,11:17].mean(axis=(1,2))])
@@ -2,14 +2,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][mnist['y_train']<=1]/255.
+from dataset import dataset
+from features import cached, mean_features
+mnist = dataset('mnist.npz')
 y_train = mnist['y_train'][mnist['y_train']<=1]
-x_test = mnist['x_test'][mnist['y_test']<=1]/255.
 y_test = mnist['y_test'][mnist['y_test']<=1]
 
-x_train = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_train])
-x_test = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_test])
+x_train = cached(mean_features, mnist, 'x_train', mnist['y_train']<=1)
+x_test = cached(mean_features, mnist, 'x_test', mnist['y_test']<=1)
 
 clf = LinearDiscriminantAnalysis()
 f_train = clf.fit_transform(x_train, y_train)
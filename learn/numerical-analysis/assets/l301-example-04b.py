@@ -2,11 +2,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][mnist['y_train']>=7]/255.
+from dataset import dataset
+from features import flatten
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')[mnist['y_train']>=7]
 y_train = mnist['y_train'][mnist['y_train']>=7]
 
-x_train = np.array([img.reshape((784,)) for img in x_train[:3000]])
+x_train = flatten(x_train[:3000])
 y_train = y_train[:3000]
 
 clf = LinearDiscriminantAnalysis(n_components=2)
@@ -2,10 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn import svm
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][mnist['y_train']<=1]/255.
+from dataset import dataset
+from features import cached, mean_features
+mnist = dataset('mnist.npz')
 y_train = mnist['y_train'][mnist['y_train']<=1]
-x_train = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_train])
+x_train = cached(mean_features, mnist, 'x_train', mnist['y_train']<=1)
 
 clf = svm.SVC(kernel='linear', C=1.0)
 clf.fit(x_train, y_train)
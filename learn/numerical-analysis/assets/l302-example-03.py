@@ -2,14 +2,16 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn import svm
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][:10000]/255.
+from dataset import dataset
+from features import flatten
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')[:10000]
 y_train = mnist['y_train'][:10000]
-x_test = mnist['x_test']/255.
+x_test = mnist.images('x_test')
 y_test = mnist['y_test']
 
-x_train = np.array([img.reshape((784,)) for img in x_train])
-x_test = np.array([img.reshape((784,)) for img in x_test])
+x_train = flatten(x_train)
+x_test = flatten(x_test)
 
 clf = svm.SVC(C=5., gamma=0.05, verbose=True)
 clf.fit(x_train, y_train)
@@ -1,16 +1,17 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][mnist['y_train']<=1]/255.
+from dataset import dataset, one_hot
+from features import cached, mean_features
+mnist = dataset('mnist.npz')
 y_train = mnist['y_train'][mnist['y_train']<=1]
 
-x_train = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_train])
-y_train = np.array([[[1,0],[0,1]][n] for n in y_train])
+x_train = cached(mean_features, mnist, 'x_train', mnist['y_train']<=1)
+y_train = one_hot(y_train, 2)
 
 from neurons import neurons
 model = neurons([2,5,2])
-out = np.array([model.predict(x) for x in x_train])
+out = model.predict_batch(x_train)
 
 fig = plt.figure(figsize=(6,6), dpi=80)
 plt.subplot(2,1,1)
@@ -1,16 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][mnist['y_train']<=1]/255.
+from dataset import dataset, one_hot
+from features import cached, mean_features
+mnist = dataset('mnist.npz')
 y_train = mnist['y_train'][mnist['y_train']<=1]
-x_test = mnist['x_test'][mnist['y_test']<=1]/255.
 y_test = mnist['y_test'][mnist['y_test']<=1]
 
-x_train = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_train])
-y_train = np.array([[[1,0],[0,1]][n] for n in y_train])
-x_test = np.array([[img.mean(),img[10:18,11:17].mean()] for img in x_test])
-y_test = np.array([[[1,0],[0,1]][n] for n in y_test])
+x_train = cached(mean_features, mnist, 'x_train', mnist['y_train']<=1)
+y_train = one_hot(y_train, 2)
+x_test = cached(mean_features, mnist, 'x_test', mnist['y_test']<=1)
+y_test = one_hot(y_test, 2)
 
 from neurons import neurons
 model = neurons([2,5,5,2])
@@ -21,7 +21,7 @@ print('Loss: %.5f, Acc: %.5f' % model.evaluate(x_train, y_train))
 print('Performance (testing)')
 print('Loss: %.5f, Acc: %.5f' % model.evaluate(x_test, y_test))
 
-out = np.array([model.predict(x) for x in x_train])
+out = model.predict_batch(x_train)
 
 fig = plt.figure(figsize=(6,6), dpi=80)
 plt.subplot(2,1,1)
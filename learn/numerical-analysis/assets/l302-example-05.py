@@ -1,11 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train']/255.
-y_train = np.array([np.eye(10)[n] for n in mnist['y_train']])
-x_test = mnist['x_test']/255.
-y_test = np.array([np.eye(10)[n] for n in mnist['y_test']])
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')
+y_train = mnist.onehot('y_train')
+x_test = mnist.images('x_test')
+y_test = mnist.onehot('y_test')
 
 from neurons import neurons
 model = neurons([784,30,10])
@@ -16,7 +17,7 @@ print('Loss: %.5f, Acc: %.5f' % model.evaluate(x_train, y_train))
 print('Performance (testing)')
 print('Loss: %.5f, Acc: %.5f' % model.evaluate(x_test, y_test))
 
-p_test = np.array([model.predict(x) for x in x_test])
+p_test = model.predict_batch(x_test)
 
 fig = plt.figure(figsize=(10,10), dpi=80)
 for i in range(100):
@@ -2,9 +2,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import copy
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train'][:10000]/255.
-y_train = np.array([np.eye(10)[n] for n in mnist['y_train'][:10000]])
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')[:10000]
+y_train = mnist['y_train'][:10000]
 
 scores = np.zeros((2,50))
 
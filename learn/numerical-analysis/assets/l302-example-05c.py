@@ -0,0 +1,25 @@
+import numpy as np
+
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')[:10000]
+y_train = mnist['y_train'][:10000]
+x_test = mnist.images('x_test')
+y_test = mnist['y_test']
+
+from neurons import neurons
+np.random.seed(1)
+m64 = neurons([784,30,10])
+np.random.seed(1)
+m32 = neurons([784,30,10], dtype=np.float32)
+
+np.random.seed(2)
+m64.fit(x_train, y_train, 10, 10, 3.0)
+np.random.seed(2)
+m32.fit(x_train, y_train, 10, 10, 3.0)
+
+loss64,acc64 = m64.evaluate(x_test, y_test)
+loss32,acc32 = m32.evaluate(x_test, y_test)
+print('float64 Loss: %.5f, Acc: %.5f' % (loss64,acc64))
+print('float32 Loss: %.5f, Acc: %.5f' % (loss32,acc32))
+print('float32 matches float64:', abs(acc32-acc64)<0.01)
@@ -0,0 +1,30 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from neurons import neurons
+
+if __name__ == '__main__':
+    from dataset import dataset
+    mnist = dataset('mnist.npz')
+    x_train = mnist.images('x_train')[:10000]
+    y_train = mnist['y_train'][:10000]
+    x_test = mnist.images('x_test')
+    y_test = mnist['y_test']
+
+    scores = np.zeros((4,100))
+
+    np.random.seed(1)
+    model = neurons([784,30,10])
+    def record(ep):
+        scores[0][ep],scores[1][ep] = model.evaluate(x_train, y_train)
+        scores[2][ep],scores[3][ep] = model.evaluate(x_test, y_test)
+    model.fit_parallel(x_train, y_train, 100, 100, 3.0, processes=4, callback=record)
+
+    vep = np.linspace(1.,100.,100)
+    fig = plt.figure(figsize=(6,6), dpi=80)
+    plt.subplot(2,1,1)
+    plt.plot(vep,scores[0], lw=3)
+    plt.plot(vep,scores[2], lw=3)
+    plt.subplot(2,1,2)
+    plt.plot(vep,scores[1], lw=3)
+    plt.plot(vep,scores[3], lw=3)
+    plt.show()
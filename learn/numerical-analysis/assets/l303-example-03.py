@@ -1,11 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-mnist = np.load('mnist.npz')
-x_train = mnist['x_train']/255.
-y_train = np.array([np.eye(10)[n] for n in mnist['y_train']])
-x_test = mnist['x_test']/255.
-y_test = np.array([np.eye(10)[n] for n in mnist['y_test']])
+from dataset import dataset
+mnist = dataset('mnist.npz')
+x_train = mnist.images('x_train')
+y_train = mnist.onehot('y_train')
+x_test = mnist.images('x_test')
+y_test = mnist.onehot('y_test')
 
 from keras.models import Sequential
 from keras.layers import Dense, Reshape
@@ -0,0 +1,39 @@
+import numpy as np
+from roots import flat
+
+FRAC = 0.38197
+
+def minimize(f, a, c, args=(), parabolic=True, tol=1E-14, maxiter=150):
+    shape = np.broadcast(a,c,*args).shape
+    a, c = flat(shape,a,c)
+    b = a+(c-a)*FRAC
+    args = [np.broadcast_to(v,shape).ravel() for v in args]
+    fa, fb, fc = f(a,*args), f(b,*args), f(c,*args)
+    act = np.ones(a.shape,bool)
+    for step in range(maxiter):
+        idx = np.flatnonzero(act)
+        if len(idx)==0: break
+        ai, bi, ci = a[idx], b[idx], c[idx]
+        fai, fbi, fci = fa[idx], fb[idx], fc[idx]
+
+        d = np.where(abs(ai-bi)>abs(ci-bi),bi+(ai-bi)*FRAC,bi+(ci-bi)*FRAC)
+        if parabolic:
+            P = (bi-ai)*(bi-ai)*(fbi-fci) - (bi-ci)*(bi-ci)*(fbi-fai)
+            Q = (bi-ai)*(fbi-fci) - (bi-ci)*(fbi-fai)
+            with np.errstate(divide='ignore',invalid='ignore'):
+                dp = bi - 0.5*P/Q
+            ok = np.isfinite(dp) & ((dp-ai)*(dp-ci)<=0.)
+            d[ok] = dp[ok]
+        fd = f(d,*[v[idx] for v in args])
+        act[idx[abs(bi-d)<tol]] = False
+
+        better = fd<fbi
+        b[idx], fb[idx] = np.where(better,d,bi), np.where(better,fd,fbi)
+        d, fd = np.where(better,bi,d), np.where(better,fbi,fd)
+        left = (d-b[idx])*(ai-b[idx])>0
+        a[idx[left]], fa[idx[left]] = d[left], fd[left]
+        c[idx[~left]], fc[idx[~left]] = d[~left], fd[~left]
+    return b.reshape(shape), ~act.reshape(shape)
+
+def golden(f, a, c, args=(), tol=1E-14, maxiter=150):
+    return minimize(f, a, c, args, False, tol, maxiter)
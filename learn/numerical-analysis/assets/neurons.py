@@ -1,23 +1,93 @@
-import random
 import numpy as np
+import threading
+import multiprocessing as mp
 
-def sigma(z):
-    return 0.5*(np.tanh(0.5*z)+1.)
+def sigma(z, out=None):
+    out = np.multiply(z,0.5,out=out)
+    np.tanh(out,out=out)
+    out += 1.
+    out *= 0.5
+    return out
 def sigma_p(z):
     return sigma(z)*(1.-sigma(z))
 
+def residual(v, y, out=None):
+    if y.ndim>1: return np.subtract(v,y,out=out)
+    if out is None: out = v.copy()
+    else: np.copyto(out,v)
+    out[y,np.arange(len(y))] -= 1.
+    return out
+
+def shared(a):
+    raw = mp.RawArray('b',a.nbytes)
+    np.frombuffer(raw,a.dtype).reshape(a.shape)[...] = a
+    return raw, a.dtype, a.shape
+
+def unshared(raw, dtype, shape):
+    return np.frombuffer(raw,dtype).reshape(shape)
+
+worker = {}
+
+def worker_init(model, arrays, barrier):
+    params, x, y, grads, idx = [unshared(*a) for a in arrays]
+    model.w, model.b = model.views(params)
+    worker['model'], worker['barrier'] = model, barrier
+    worker['params'], worker['x'], worker['y'] = params, x, y
+    worker['grads'], worker['idx'] = grads, idx
+
+def worker_epoch(args):
+    # every worker walks the same shuffled minibatches in lock-step: each
+    # fills its gradient row, then rank 0 applies the summed step
+    rank, processes, batch_size, eta = args
+    model, barrier, grads, idx = worker['model'], worker['barrier'], worker['grads'], worker['idx']
+    model.delw, model.delb = model.views(grads[rank])
+    step = np.empty(grads.shape[1],grads.dtype)
+    try:
+        for k in range(0,len(idx),batch_size):
+            batch = idx[k:k+batch_size]
+            shard = np.array_split(batch,processes)[rank]
+            if len(shard): model.minibatch(worker['x'], worker['y'], shard)
+            else: grads[rank] = 0.
+            barrier.wait()
+            if rank==0:
+                np.sum(grads,axis=0,out=step)
+                step *= eta/len(batch)
+                worker['params'] -= step
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        return # another rank failed and reports the actual error
+    except BaseException:
+        # release the ranks waiting on the barrier instead of deadlocking
+        barrier.abort()
+        raise
+
 class neurons(object):
-    def __init__(self, shape):
+    def __init__(self, shape, dtype=np.float64):
         self.shape = shape
-        self.v = [np.zeros((n,1)) for n in shape]
-        self.z = [np.zeros((n,1)) for n in shape[1:]]
-        self.w = [np.random.randn(n,m) for n,m in zip(shape[1:],shape[:-1])]
-        self.b = [np.random.randn(n,1) for n in shape[1:]]
-        self.delw = [np.zeros(w.shape) for w in self.w]
-        self.delb = [np.zeros(b.shape) for b in self.b]
+        self.dtype = np.dtype(dtype)
+        self.v = [np.zeros((n,1),dtype) for n in shape]
+        self.z = [np.zeros((n,1),dtype) for n in shape[1:]]
+        self.w = [np.random.randn(n,m).astype(dtype) for n,m in zip(shape[1:],shape[:-1])]
+        self.b = [np.random.randn(n,1).astype(dtype) for n in shape[1:]]
+        self.delw = [np.zeros(w.shape,dtype) for w in self.w]
+        self.delb = [np.zeros(b.shape,dtype) for b in self.b]
+        self.ws_size = 0
+
+    def workspace(self, batch_size):
+        self.ws_size = batch_size
+        self.ws_x = np.empty(batch_size*self.shape[0],self.dtype)
+        self.ws_y = np.empty(batch_size*self.shape[-1],self.dtype)
+        self.ws_l = np.empty(batch_size,np.intp)
+        self.ws_z = [np.empty(batch_size*n,self.dtype) for n in self.shape[1:]]
+        self.ws_v = [np.empty(batch_size*n,self.dtype) for n in self.shape[1:]]
+        self.ws_d = [np.empty(batch_size*n,self.dtype) for n in self.shape[1:]]
+        self.ws_s = [np.empty(batch_size*n,self.dtype) for n in self.shape[1:]]
+
+    def buffer(self, ws, n, m):
+        return ws[:n*m].reshape((n,m))
 
     def predict(self, x):
-        self.v[0] = x.reshape(self.v[0].shape)
+        self.v[0] = np.asarray(x,dtype=self.dtype).reshape((self.shape[0],1))
         for l in range(len(self.shape)-1):
             self.z[l] = np.dot(self.w[l],self.v[l])+self.b[l]
             self.v[l+1] = sigma(self.z[l])
@@ -26,41 +96,123 @@ class neurons(object):
     def gradient(self, y):
         for l in range(len(self.shape)-2,-1,-1):
             if l==len(self.shape)-2:
-                  delta = (self.v[-1]-y.reshape(self.v[-1].shape))*sigma_p(self.z[l])
+                  delta = (self.v[-1]-np.asarray(y,dtype=self.dtype).reshape(self.v[-1].shape))*sigma_p(self.z[l])
             else: delta = np.dot(self.w[l+1].T,self.delb[l+1])*sigma_p(self.z[l])
             self.delb[l] = delta
             self.delw[l] = np.dot(delta,self.v[l].T)
 
+    def forward(self, x, workspace=False):
+        # only minibatch() passes workspace=True: the outputs then live in
+        # ws_v and are overwritten by the next such call
+        m = x.shape[1]
+        self.v[0] = x
+        for l in range(len(self.shape)-1):
+            if workspace and m<=self.ws_size:
+                n = self.shape[l+1]
+                self.z[l] = np.dot(self.w[l],self.v[l],out=self.buffer(self.ws_z[l],n,m))
+                self.z[l] += self.b[l]
+                self.v[l+1] = sigma(self.z[l],out=self.buffer(self.ws_v[l],n,m))
+            else:
+                self.z[l] = np.dot(self.w[l],self.v[l])+self.b[l]
+                self.v[l+1] = sigma(self.z[l])
+        return self.v[-1]
+
+    def backward(self, y):
+        m = y.shape[-1]
+        if m>self.ws_size:
+            for l in range(len(self.shape)-2,-1,-1):
+                if l==len(self.shape)-2:
+                      delta = residual(self.v[-1],y)*sigma_p(self.z[l])
+                else: delta = np.dot(self.w[l+1].T,delta)*sigma_p(self.z[l])
+                self.delb[l] = delta.sum(axis=1,keepdims=True)
+                self.delw[l] = np.dot(delta,self.v[l].T)
+            return
+        for l in range(len(self.shape)-2,-1,-1):
+            n = self.shape[l+1]
+            # sigma_p(z) = v*(1-v) with v = sigma(z) already computed in forward()
+            sp = np.subtract(1.,self.v[l+1],out=self.buffer(self.ws_s[l],n,m))
+            sp *= self.v[l+1]
+            if l==len(self.shape)-2:
+                  delta = residual(self.v[-1],y,out=self.buffer(self.ws_d[l],n,m))
+            else: delta = np.dot(self.w[l+1].T,delta,out=self.buffer(self.ws_d[l],n,m))
+            delta *= sp
+            np.sum(delta,axis=1,keepdims=True,out=self.delb[l])
+            np.dot(delta,self.v[l].T,out=self.delw[l])
+
+    def views(self, buf):
+        arrs, k = [], 0
+        for a in self.w+self.b:
+            arrs.append(buf[k:k+a.size].reshape(a.shape))
+            k += a.size
+        return arrs[:len(self.w)], arrs[len(self.w):]
+
+    def targets(self, y_data):
+        y_data = np.asarray(y_data)
+        if y_data.ndim==1 and y_data.dtype.kind in 'iu' and self.shape[-1]>1:
+            return y_data.astype(np.intp,copy=False)
+        return np.asarray(y_data,dtype=self.dtype).reshape((len(y_data),self.shape[-1]))
+
+    def minibatch(self, x_data, y_data, batch):
+        m = len(batch)
+        if m>self.ws_size: self.workspace(m)
+        x = np.take(x_data,batch,axis=0,out=self.buffer(self.ws_x,m,self.shape[0]))
+        if y_data.ndim==1:
+              y = np.take(y_data,batch,out=self.ws_l[:m])
+        else: y = np.take(y_data,batch,axis=0,out=self.buffer(self.ws_y,m,self.shape[-1])).T
+        self.forward(x.T,workspace=True)
+        self.backward(y)
+        return m
+
     def fit(self, x_data, y_data, epochs, batch_size, eta):
-        samples = list(zip(x_data, y_data))
+        x_data = np.asarray(x_data,dtype=self.dtype).reshape((len(x_data),self.shape[0]))
+        y_data = self.targets(y_data)
+        if batch_size>self.ws_size: self.workspace(batch_size)
         for ep in range(epochs):
             print('Epoch: %d/%d' % (ep+1,epochs))
-            random.shuffle(samples)
-            sum_delw = [np.zeros(w.shape) for w in self.w]
-            sum_delb = [np.zeros(b.shape) for b in self.b]
-            batch_count = 0
-            for x,y in samples:
-                self.predict(x)
-                self.gradient(y)
+            idx = np.random.permutation(len(x_data))
+            for k in range(0,len(idx),batch_size):
+                batch = idx[k:k+batch_size]
+                m = self.minibatch(x_data, y_data, batch)
                 for l in range(len(self.shape)-1):
-                    sum_delw[l] += self.delw[l]
-                    sum_delb[l] += self.delb[l]
-                batch_count += 1
-                if batch_count>=batch_size or (x is samples[-1][0]):
-                    for l in range(len(self.shape)-1):
-                        self.w[l] -= eta/batch_count*sum_delw[l]
-                        self.b[l] -= eta/batch_count*sum_delb[l]
-                        sum_delw[l],sum_delb[l] = 0.,0.
-                    batch_count = 0
+                    self.delw[l] *= eta/m
+                    self.delb[l] *= eta/m
+                    self.w[l] -= self.delw[l]
+                    self.b[l] -= self.delb[l]
             ret = self.evaluate(x_data, y_data)
             print('Loss: %.4f, Acc: %.4f' % ret)
 
-    def evaluate(self, x_data, y_data):
-        loss, cnt = 0., 0.
-        for x,y in zip(x_data, y_data):
-            self.predict(x)
-            loss += ((self.v[-1]-y.reshape(self.v[-1].shape))**2).sum()
-            if np.argmax(self.v[-1])==np.argmax(y): cnt += 1.
-        loss /= 2.*len(x_data)
-        return loss, cnt/len(x_data)
+    def fit_parallel(self, x_data, y_data, epochs, batch_size, eta, processes=None, callback=None):
+        x_data = np.asarray(x_data,dtype=self.dtype).reshape((len(x_data),self.shape[0]))
+        y_data = self.targets(y_data)
+        if processes is None: processes = mp.cpu_count()
+        params = np.concatenate([a.ravel() for a in self.w+self.b])
+        arrays = [shared(a) for a in (params,x_data,y_data,np.zeros((processes,len(params)),self.dtype),
+                                      np.arange(len(x_data)))]
+        params, x_data, y_data, grads, idx = [unshared(*a) for a in arrays]
+        self.w, self.b = self.views(params)
+        barrier = mp.Barrier(processes)
+        with mp.Pool(processes, worker_init, (self,arrays,barrier)) as pool:
+            for ep in range(epochs):
+                print('Epoch: %d/%d' % (ep+1,epochs))
+                idx[:] = np.random.permutation(len(x_data))
+                pool.map(worker_epoch, [(rank,processes,batch_size,eta) for rank in range(processes)], chunksize=1)
+                ret = self.evaluate(x_data, y_data)
+                print('Loss: %.4f, Acc: %.4f' % ret)
+                if callback is not None: callback(ep)
+        self.w = [w.copy() for w in self.w]
+        self.b = [b.copy() for b in self.b]
 
+    def predict_batch(self, x_data):
+        x_data = np.asarray(x_data,dtype=self.dtype).reshape((len(x_data),self.shape[0]))
+        return self.forward(x_data.T).T
+
+    def evaluate(self, x_data, y_data):
+        p = self.predict_batch(x_data)
+        y = self.targets(y_data)
+        if y.ndim==1:
+            loss = ((p**2).sum()-2.*p[np.arange(len(y)),y].sum()+len(y))/(2.*len(x_data))
+            acc = (p.argmax(axis=1)==y).mean()
+        else:
+            loss = ((p-y)**2).sum()/(2.*len(x_data))
+            acc = (p.argmax(axis=1)==y.argmax(axis=1)).mean()
+        return loss, acc
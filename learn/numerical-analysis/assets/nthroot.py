@@ -0,0 +1,24 @@
+import numpy as np
+
+def guess(R, n):
+    m, e = np.frexp(R)
+    t = (e+2.*m-2.)/n # log2(R) with log2(m) ~ 2m-2 on [0.5,1)
+    k = np.floor(t)
+    with np.errstate(invalid='ignore'):
+        return np.ldexp(1.+(t-k),k.astype(int))
+
+def nthroot(R, n, iterations=4):
+    R = np.asarray(R,dtype=float)
+    sign = np.sign(R) if n%2 else np.where(R<0.,np.nan,1.)
+    A = abs(R)
+    x = guess(A,n)
+    for step in range(iterations):
+        x = ((n-1)*x+A/x**(n-1))/n
+    x = np.where((A==0.) | ~np.isfinite(A),A,x)
+    return sign*x
+
+def squareroot(R, iterations=4):
+    return nthroot(R,2,iterations)
+
+def cubicroot(R, iterations=4):
+    return nthroot(R,3,iterations)
@@ -0,0 +1,54 @@
+import numpy as np
+from scipy.integrate import RK45
+from events import values, crossings
+
+class stream(object):
+    def __init__(self, f, t, y, method=RK45, events=(), **options):
+        # frame boundaries no longer cap the step size, so tighter defaults
+        # than solve_ivp are needed to stay as accurate as the restarts
+        options.setdefault('rtol',1E-8)
+        options.setdefault('atol',1E-10)
+        self.solver = method(f, t, np.array(y,dtype=float), np.inf, **options)
+        self.interp = None
+        self.events = events
+        self.g = values(events,t,self.solver.y)
+        self.t_events = [[] for g in events]
+        self.y_events = [[] for g in events]
+        self.t_end, self.y_end = None, None
+
+    @property
+    def t(self):
+        return self.solver.t if self.t_end is None else self.t_end
+
+    @property
+    def terminated(self):
+        return self.t_end is not None
+
+    def step(self):
+        self.solver.step()
+        if self.solver.status=='failed': raise RuntimeError(self.solver.message)
+        self.interp = None
+        if self.events: self.detect()
+
+    def detect(self):
+        g = values(self.events,self.solver.t,self.solver.y)
+        self.interp = self.solver.dense_output()
+        for i, te, ye in crossings(self.events,self.solver.t_old,self.g,self.solver.t,g,self.interp):
+            self.t_events[i].append(te)
+            self.y_events[i].append(ye)
+            if getattr(self.events[i],'terminal',False):
+                self.t_end, self.y_end = te, ye
+        self.g = g
+
+    def advance(self, t):
+        while self.solver.t<t and not self.terminated: self.step()
+        if self.terminated and t>=self.t_end: return self.y_end.copy()
+        if t==self.solver.t: return self.solver.y.copy()
+        if self.interp is None: self.interp = self.solver.dense_output()
+        return self.interp(t)
+
+    def output(self, times):
+        for t in times:
+            y = self.advance(t)
+            if t>self.t: return
+            yield t, y
@@ -0,0 +1,34 @@
+import numpy as np
+
+class recorder(object):
+    def __init__(self, ncols, every=1, samples=None, nsteps=None, size=4096):
+        # keep every k-th call, or about 'samples' rows out of 'nsteps' calls
+        if samples is not None and nsteps is not None:
+            every = max(1,int(nsteps)//int(samples))
+            size = int(nsteps)//every+1
+        self.every = every
+        self.buf = np.empty((size,1+ncols))
+        self.n = 0
+        self.calls = 0
+
+    def __call__(self, t, *values):
+        self.calls += 1
+        if (self.calls-1)%self.every: return
+        if self.n==len(self.buf):
+            self.buf = np.resize(self.buf,(2*len(self.buf),self.buf.shape[1]))
+        row = self.buf[self.n]
+        row[0] = t
+        row[1:] = values
+        self.n += 1
+
+    @property
+    def t(self):
+        return self.buf[:self.n,0]
+
+    @property
+    def y(self):
+        return self.buf[:self.n,1:]
+
+    def relerr(self, exact):
+        ref = exact(self.t)[:,None]
+        return abs(self.y-ref)/abs(ref)
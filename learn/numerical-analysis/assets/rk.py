@@ -0,0 +1,39 @@
+import numpy as np
+
+TABLEAU = {
+    'euler': ([[]], [1.], [0.]),
+    'rk2':   ([[], [0.5]], [0., 1.], [0., 0.5]),
+    'rk4':   ([[], [0.5], [0., 0.5], [0., 0., 1.]], [1./6., 1./3., 1./3., 1./6.], [0., 0.5, 0.5, 1.]),
+}
+
+class ensemble(object):
+    def __init__(self, f, y, t=0., method='rk4'):
+        self.f = f
+        self.y = np.array(y,dtype=float)
+        self.t = t
+        self.nfev = 0
+        self.a, self.b, self.c = TABLEAU[method]
+        self.k = [np.empty_like(self.y) for b in self.b]
+        self.ytmp = np.empty_like(self.y)
+        self.work = np.empty_like(self.y)
+
+    def axpy(self, alpha, x, y):
+        np.multiply(x,alpha,out=self.work)
+        y += self.work
+
+    def step(self, h):
+        for i in range(len(self.b)):
+            np.copyto(self.ytmp,self.y)
+            for j, a in enumerate(self.a[i]):
+                if a: self.axpy(h*a,self.k[j],self.ytmp)
+            self.f(self.t+self.c[i]*h,self.ytmp,self.k[i])
+        for i, b in enumerate(self.b):
+            if b: self.axpy(h*b,self.k[i],self.y)
+        self.t += h
+        self.nfev += len(self.b)
+        return self.y
+
+    def run(self, t_end, h):
+        while self.t<t_end-h*1E-9:
+            self.step(min(h,t_end-self.t))
+        return self.y
@@ -0,0 +1,110 @@
+import numpy as np
+from events import values, crossings
+
+class cashkarp(object):
+    C = np.array([0., 1./5., 3./10., 3./5., 1., 7./8.])
+    A = np.array([
+        [0., 0., 0., 0., 0.],
+        [1./5., 0., 0., 0., 0.],
+        [3./40., 9./40., 0., 0., 0.],
+        [3./10., -9./10., 6./5., 0., 0.],
+        [-11./54., 5./2., -70./27., 35./27., 0.],
+        [1631./55296., 175./512., 575./13824., 44275./110592., 253./4096.]])
+    B5 = np.array([37./378., 0., 250./621., 125./594., 0., 512./1771.])
+    B4 = np.array([2825./27648., 0., 18575./48384., 13525./55296., 277./14336., 1./4.])
+    E = B5-B4
+
+    def __init__(self, f, t, y, h=0.001, rtol=1E-8, atol=1E-12, hmax=np.inf, events=()):
+        self.f = f
+        self.t = t
+        self.y = np.array(y,dtype=float)
+        self.h, self.hmax = h, hmax
+        self.rtol, self.atol = rtol, atol
+        self.K = np.empty((6,)+self.y.shape)
+        self.K[0] = f(t,self.y)
+        self.nfev = 1
+        self.steps = 0
+        self.t_old, self.y_old, self.k_old = t, self.y.copy(), self.K[0].copy()
+        self.events = events
+        self.g = values(events,t,self.y)
+        self.t_events = [[] for g in events]
+        self.y_events = [[] for g in events]
+        self.terminated = False
+        self.bump = None
+
+    def attempt(self, h):
+        # K[0] = f(t,y) is kept from the end of the previous step and is
+        # reused by every retry of a rejected step
+        for i in range(1,6):
+            self.K[i] = self.f(self.t+self.C[i]*h,self.y+h*np.tensordot(self.A[i,:i],self.K[:i],axes=1))
+        self.nfev += 5
+        yn = self.y+h*np.tensordot(self.B5,self.K,axes=1)
+        scale = self.atol+self.rtol*np.maximum(abs(self.y),abs(yn))
+        err = max(np.max(abs(h*np.tensordot(self.E,self.K,axes=1))/scale),0.01)
+        return yn, err
+
+    def step(self):
+        h = min(self.h,self.hmax)
+        while True:
+            yn, err = self.attempt(h)
+            if not np.isfinite(err):
+                raise RuntimeError('non-finite error estimate at t = %g' % self.t)
+            if err<1.: break
+            h = max(0.9*h*err**-0.25,h*0.1)
+            if h<np.spacing(self.t):
+                raise RuntimeError('step size fell below spacing(t) at t = %g' % self.t)
+        self.t_old, self.y_old, self.k_old = self.t, self.y, self.K[0].copy()
+        self.t, self.y = self.t+h, yn
+        self.K[0] = self.f(self.t,self.y)
+        self.nfev += 1
+        self.steps += 1
+        self.bump = None
+        self.h = min(0.9*h*err**-0.2,h*5.)
+        if self.events: self.detect()
+        return self.t, self.y
+
+    def detect(self):
+        g = values(self.events,self.t,self.y)
+        for i, te, ye in crossings(self.events,self.t_old,self.g,self.t,g,self.dense):
+            self.t_events[i].append(te)
+            self.y_events[i].append(ye)
+            if getattr(self.events[i],'terminal',False):
+                # cut the last step back to the event so that dense() and
+                # advance() never reach beyond it
+                self.t, self.y = te, ye
+                self.K[0] = self.f(te,ye)
+                self.nfev += 1
+                self.terminated = True
+                self.bump = None
+                g = values(self.events,te,ye)
+        self.g = g
+
+    def hermite(self, s, h):
+        h00, h10 = (1.+2.*s)*(1.-s)**2, s*(1.-s)**2
+        h01, h11 = s*s*(3.-2.*s), s*s*(s-1.)
+        return h00*self.y_old+h10*h*self.k_old+h01*self.y+h11*h*self.K[0]
+
+    def dense(self, t):
+        # cubic Hermite through y, f at both ends of the last step plus a
+        # quartic bump s^2(1-s)^2 fitted to f at s=1/4: one extra RHS call per
+        # interpolated step, 4th order instead of the plain cubic's 3rd
+        h = self.t-self.t_old
+        if self.bump is None:
+            s = 0.25
+            dh = ((6.*s*s-6.*s)*self.y_old+(3.*s*s-4.*s+1.)*h*self.k_old
+                  +(6.*s-6.*s*s)*self.y+(3.*s*s-2.*s)*h*self.K[0])
+            self.bump = (h*self.f(self.t_old+s*h,self.hermite(s,h))-dh)/(2.*s*(1.-s)*(1.-2.*s))
+            self.nfev += 1
+        s = (t-self.t_old)/h
+        return self.hermite(s,h)+self.bump*(s*(1.-s))**2
+
+    def advance(self, t):
+        while self.t<t and not self.terminated: self.step()
+        if t>=self.t: return self.y.copy()
+        return self.dense(t)
+
+    def output(self, times):
+        for t in times:
+            y = self.advance(t)
+            if t>self.t: return
+            yield t, y
@@ -0,0 +1,26 @@
+import numpy as np
+
+def stack(score0, score1):
+    scores = np.concatenate([score0,score1])
+    labels = np.concatenate([np.zeros(len(score0),bool),np.ones(len(score1),bool)])
+    return scores, labels
+
+def roc_curve(scores, labels):
+    labels = np.asarray(labels,dtype=bool)
+    order = np.argsort(scores,kind='mergesort')[::-1]
+    s, l = np.asarray(scores)[order], labels[order]
+    tp = np.cumsum(l)
+    fp = np.arange(1,len(l)+1)-tp
+    last = np.r_[np.flatnonzero(s[1:]!=s[:-1]),len(s)-1]
+    tpr = np.r_[0.,tp[last]/tp[-1]]
+    fpr = np.r_[0.,fp[last]/fp[-1]]
+    thresholds = np.r_[np.inf,s[last]]
+    return fpr, tpr, thresholds
+
+def auc(x, y):
+    return abs((np.diff(x)*(y[1:]+y[:-1])).sum())*0.5
+
+def best_threshold(fpr, tpr, thresholds):
+    avg = (tpr+(1.-fpr))/2.
+    i = avg.argmax()
+    return thresholds[i], avg[i]
@@ -0,0 +1,68 @@
+import numpy as np
+
+def flat(shape, *arrays):
+    # the active-set bookkeeping works on flat indices, so solve on 1-D copies
+    return [np.array(np.broadcast_to(v,shape),dtype=float).ravel() for v in arrays]
+
+def bisect(f, a, b, args=(), tol=1E-14, maxiter=100):
+    shape = np.broadcast(a,b,*args).shape
+    a, b = flat(shape,a,b)
+    args = [np.broadcast_to(v,shape).ravel() for v in args]
+    fa = f(a,*args)
+    act = np.ones(a.shape,bool)
+    for step in range(maxiter):
+        idx = np.flatnonzero(act)
+        if len(idx)==0: break
+        c = (a[idx]+b[idx])*0.5
+        fc = f(c,*[v[idx] for v in args])
+        done = abs(a[idx]-c)<tol
+        left = fc*fa[idx]>0.
+        a[idx[left]], fa[idx[left]] = c[left], fc[left]
+        b[idx[~left]] = c[~left]
+        act[idx[done]] = False
+    return ((a+b)*0.5).reshape(shape), ~act.reshape(shape)
+
+def solve(f, a, c, b=None, fp=None, args=(), tol=1E-14, maxiter=50):
+    shape = np.broadcast(a,c,*args).shape if b is None else np.broadcast(a,b,c,*args).shape
+    a, c = flat(shape,a,c)
+    b = (a+c)*0.5 if b is None else flat(shape,b)[0]
+    args = [np.broadcast_to(v,shape).ravel() for v in args]
+    fa, fb, fc = f(a,*args), f(b,*args), f(c,*args)
+    x = b.copy()
+    act = np.ones(a.shape,bool)
+    for step in range(maxiter):
+        idx = np.flatnonzero(act)
+        if len(idx)==0: break
+        ai, bi, ci = a[idx], b[idx], c[idx]
+        argi = [v[idx] for v in args]
+        fai, fbi, fci = fa[idx], fb[idx], fc[idx]
+        with np.errstate(divide='ignore',invalid='ignore'):
+            if fp is None:
+                R, S, T = fbi/fci, fbi/fai, fai/fci
+                P = S*(T*(R-T)*(ci-bi)-(1.-R)*(bi-ai))
+                Q = (T-1.)*(R-1.)*(S-1.)
+                d = bi+P/Q
+            else:
+                d = bi-fbi/fp(bi,*argi)
+        fd = np.full(d.shape,np.inf)
+        ok = np.isfinite(d)
+        fd[ok] = f(d[ok],*[v[ok] for v in argi])
+
+        bad = ~ok | ((((d-ai)*(d-ci)>0.) | (abs(fd)>abs(fbi))) & (abs(bi-d)>=tol))
+        if bad.any():
+            d[bad] = np.where(fai[bad]*fbi[bad]>0.,(bi[bad]+ci[bad])*0.5,(ai[bad]+bi[bad])*0.5)
+            fd[bad] = f(d[bad],*[v[bad] for v in argi])
+
+        x[idx] = d
+        act[idx[abs(bi-d)<tol]] = False
+
+        if fp is None:
+            right = fai*fbi>0.
+            a[idx[right]], fa[idx[right]] = bi[right], fbi[right]
+            c[idx[~right]], fc[idx[~right]] = bi[~right], fbi[~right]
+        else:
+            right = fai*fd>0.
+            a[idx[right]], fa[idx[right]] = d[right], fd[right]
+            c[idx[~right]], fc[idx[~right]] = d[~right], fd[~right]
+        b[idx], fb[idx] = d, fd
+    return x.reshape(shape), ~act.reshape(shape)
@@ -0,0 +1,84 @@
+import numpy as np
+import scipy.sparse as sparse
+
+class network(object):
+    def __init__(self, x, edges, k, R0=None, m=1., g=9.8, fixed=()):
+        self.x0 = np.array(x,dtype=float)
+        self.N, self.dim = self.x0.shape
+        self.n = self.N*self.dim
+        self.edges = np.asarray(edges,dtype=np.intp)
+        self.i, self.j = self.edges[:,0].copy(), self.edges[:,1].copy()
+        E = len(self.edges)
+        self.k = np.broadcast_to(np.asarray(k,dtype=float),(E,))
+        self.m = np.broadcast_to(np.asarray(m,dtype=float),(self.N,))[:,None]
+        self.g = g
+        self.fixed = np.asarray(fixed,dtype=np.intp)
+        # incidence matrix: edge e pushes +f on node j and -f on node i
+        self.B = sparse.csr_matrix((np.r_[-np.ones(E),np.ones(E)],
+                                    (np.r_[self.i,self.j],np.r_[np.arange(E),np.arange(E)])),
+                                   shape=(self.N,E))
+        self.xi = np.empty((E,self.dim))
+        self.d  = np.empty((E,self.dim))
+        self.R  = np.empty(E)
+        self.fs = np.empty(E)
+        self.R0 = self.lengths(self.x0).copy() if R0 is None else np.broadcast_to(np.asarray(R0,dtype=float),(E,))
+
+    def state(self, v=None):
+        y = np.zeros(2*self.n)
+        y[:self.n] = self.x0.ravel()
+        if v is not None: y[self.n:] = np.asarray(v,dtype=float).ravel()
+        return y
+
+    def positions(self, y):
+        return y[:self.n].reshape(self.N,self.dim)
+
+    def velocities(self, y):
+        return y[self.n:].reshape(self.N,self.dim)
+
+    def lengths(self, x):
+        # mode='raise' would stage the result in a temporary; the edge indices
+        # are fixed at construction, so skip the bounds check
+        np.take(x,self.j,axis=0,out=self.d,mode='clip')
+        np.take(x,self.i,axis=0,out=self.xi,mode='clip')
+        self.d -= self.xi
+        np.einsum('ij,ij->i',self.d,self.d,out=self.R)
+        np.sqrt(self.R,out=self.R)
+        return self.R
+
+    def f(self, t, y, dydt):
+        dydt[:self.n] = y[self.n:]
+        R = self.lengths(self.positions(y))
+        np.subtract(R,self.R0,out=self.fs)
+        self.fs *= self.k
+        self.fs /= R
+        self.fs *= -1.
+        self.d *= self.fs[:,None]
+        a = dydt[self.n:].reshape(self.N,self.dim)
+        # the sparse product allocates one (N,dim) temporary per call, but is
+        # several times faster than scattering with np.add.at
+        a[:] = self.B @ self.d
+        a /= self.m
+        a[:,1] -= self.g
+        a[self.fixed] = 0.
+
+    def energy(self, y):
+        x, v = self.positions(y), self.velocities(y)
+        R = self.lengths(x)
+        return (self.m*self.g*x[:,1:2]).sum() + 0.5*(self.m*v**2).sum() + 0.5*(self.k*(R-self.R0)**2).sum()
+
+def chain(n, R0=0.5, k=200., m=0.5, g=9.8, angle=0.):
+    x = np.zeros((n+1,2))
+    x[1:,0] = np.arange(1,n+1)*R0*np.sin(angle)
+    x[1:,1] = -np.arange(1,n+1)*R0*np.cos(angle)
+    edges = np.c_[np.arange(n),np.arange(1,n+1)]
+    return network(x, edges, k, R0, m, g, fixed=[0])
+
+def mesh(nx, ny, spacing=0.1, k=200., m=0.5, g=9.8):
+    gx, gy = np.meshgrid(np.arange(nx)*spacing, -np.arange(ny)*spacing)
+    x = np.c_[gx.ravel(),gy.ravel()]
+    idx = np.arange(nx*ny).reshape(ny,nx)
+    edges = np.vstack([np.c_[idx[:,:-1].ravel(),idx[:,1:].ravel()],
+                       np.c_[idx[:-1,:].ravel(),idx[1:,:].ravel()],
+                       np.c_[idx[:-1,:-1].ravel(),idx[1:,1:].ravel()],
+                       np.c_[idx[:-1,1:].ravel(),idx[1:,:-1].ravel()]])
+    return network(x, edges, k, None, m, g, fixed=idx[0])
@@ -0,0 +1,44 @@
+import numpy as np
+
+CBRT2 = 2.**(1./3.)
+YOSHIDA = [1./(2.-CBRT2), -CBRT2/(2.-CBRT2), 1./(2.-CBRT2)]
+
+class symplectic(object):
+    def __init__(self, force, q, v, m=1., t=0., method='yoshida'):
+        self.force = force
+        self.m = m
+        self.q = np.array(q,dtype=float)
+        self.v = np.array(v,dtype=float)
+        self.t = t
+        self.method = method
+        self.a = None
+        self.nfev = 0
+
+    def accel(self):
+        self.a = self.force(self.q)/self.m
+        self.nfev += 1
+        return self.a
+
+    def verlet(self, h):
+        if self.a is None: self.accel()
+        self.v += 0.5*h*self.a
+        self.q += h*self.v
+        self.v += 0.5*h*self.accel()
+
+    def leapfrog(self, h):
+        self.q += 0.5*h*self.v
+        self.v += h*self.accel()
+        self.q += 0.5*h*self.v
+
+    def step(self, h):
+        if self.method=='verlet': self.verlet(h)
+        elif self.method=='leapfrog': self.leapfrog(h)
+        else:
+            for w in YOSHIDA: self.verlet(w*h)
+        self.t += h
+        return self.q, self.v
+
+    def run(self, t_end, h):
+        while self.t<t_end-h*1E-9:
+            self.step(min(h,t_end-self.t))
+        return self.q, self.v
@@ -0,0 +1,33 @@
+import numpy as np
+import scipy.optimize as opt
+import multiprocessing as mp
+
+def fit_toys(args):
+    model, vx, mu, p_init, seed, start, stop = args
+    npar = len(p_init)
+    params = np.full((stop-start,npar),np.nan)
+    covs = np.full((stop-start,npar,npar),np.nan)
+    for i in range(start,stop):
+        vy = np.random.default_rng([seed,i]).poisson(mu).astype(float)
+        vyerr = np.maximum(vy,1.)**0.5
+        try:
+            params[i-start], covs[i-start] = opt.curve_fit(model,vx,vy,p_init,vyerr)
+        except (RuntimeError, ValueError):
+            pass
+    return start, params, covs
+
+def run_toys(model, vx, mu, p_nominal, ntoys, processes=None, seed=0, chunk=100):
+    p_nominal = np.asarray(p_nominal,dtype=float)
+    npar = len(p_nominal)
+    params = np.empty((ntoys,npar))
+    covs = np.empty((ntoys,npar,npar))
+    tasks = [(model,vx,mu,p_nominal,seed,k,min(k+chunk,ntoys)) for k in range(0,ntoys,chunk)]
+    with mp.Pool(processes) as pool:
+        for start, p, c in pool.imap_unordered(fit_toys,tasks):
+            params[start:start+len(p)] = p
+            covs[start:start+len(c)] = c
+    with np.errstate(invalid='ignore'):
+        pulls = (params-p_nominal)/np.sqrt(np.diagonal(covs,axis1=1,axis2=2))
+    ok = np.isfinite(pulls).all(axis=1)
+    coverage = (abs(pulls[ok])<1.).mean(axis=0)
+    return params, covs, pulls, coverage